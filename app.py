@@ -2,9 +2,20 @@ import os
 os.environ['STREAMLIT_SERVER_HEADLESS'] = 'true'
 os.environ['STREAMLIT_BROWSER_GATHER_USAGE_STATS'] = 'false'
 
+import logging
+
+# Root handler for the module loggers (fetchers, database) - without one
+# their INFO/DEBUG lines are dropped and only WARNING+ reaches stderr
+logging.basicConfig(
+    level=getattr(logging, os.getenv('LOG_LEVEL', 'INFO').upper(), logging.INFO),
+    format='%(asctime)s %(levelname)s %(name)s: %(message)s',
+)
+
 import streamlit as st
 import asyncio
+import threading
 from datetime import datetime, timezone, timedelta
+from operator import itemgetter
 import time
 
 # Page config MUST be first Streamlit command
@@ -15,16 +26,26 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Import modules
+# Import fetch modules eagerly (used on every auto-fetch); summarizer and
+# telegram_alerts are imported lazily inside their handlers so cold start
+# doesn't pay for google-generativeai / python-telegram-bot up front
 try:
     from news_fetcher import fetch_news_live
     from newsapi_fetcher import fetch_newsapi_articles_live
-    from summarizer import analyze_article_live
-    from telegram_alerts import send_automatic_alerts, send_test_alert, get_alert_stats
+    from pipeline import filter_last_hour_articles, safe_parse_dt
 except ImportError as e:
     st.error(f"Error importing modules: {e}")
     st.stop()
 
+# JS-side refresh timer: triggers a rerun every 15 minutes so the cached
+# pipeline re-checks its TTL without Python-side polling. Optional - the
+# app still refreshes on any interaction if the component isn't installed.
+try:
+    from streamlit_autorefresh import st_autorefresh
+    st_autorefresh(interval=15 * 60 * 1000, key='bg_refresh')
+except ImportError:
+    pass
+
 # Initialize session state
 if 'articles_cache' not in st.session_state:
     st.session_state.articles_cache = []
@@ -32,93 +53,391 @@ if 'last_fetch_time' not in st.session_state:
     st.session_state.last_fetch_time = None
 if 'auto_alerts_enabled' not in st.session_state:
     st.session_state.auto_alerts_enabled = True
+if 'source_options' not in st.session_state:
+    st.session_state.source_options = ["All"]
+if 'pending_alerts' not in st.session_state:
+    st.session_state.pending_alerts = None
+if 'pending_test' not in st.session_state:
+    st.session_state.pending_test = None
 
-def filter_last_hour_articles(articles):
-    """Filter articles to only include those from the last hour"""
-    cutoff_time = datetime.now(timezone.utc) - timedelta(hours=1)
-    recent_articles = []
-    
-    for article in articles:
-        try:
-            published_at = article.get('published_at', '')
-            if not published_at:
-                continue
-            published_dt = datetime.fromisoformat(published_at.replace('Z', '+00:00'))
-            if published_dt > cutoff_time:
-                recent_articles.append(article)
-        except:
-            continue
-    
-    return recent_articles
+@st.cache_resource
+def _background_loop():
+    """Event loop on a daemon thread for Telegram deliveries.
+    cache_resource makes it a process-wide singleton shared by all sessions."""
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    return loop
+
+async def _analyze_all(articles, batch_size=10, max_concurrency=3):
+    """Analyze articles as concurrent Gemini batches.
+
+    Ten articles share one prompt (one round-trip instead of ten) and the
+    batches themselves run concurrently, capped by a semaphore. Returns
+    per-article results aligned with the input order; a failed batch is
+    reported as one exception entry per article in it.
+    """
+    from summarizer import analyze_articles_batch
+    sem = asyncio.Semaphore(max_concurrency)
+
+    async def _one_batch(batch):
+        async with sem:
+            return await asyncio.to_thread(
+                analyze_articles_batch,
+                [(a.get('title', ''), a.get('description', '')) for a in batch],
+            )
+
+    batches = [articles[i:i + batch_size] for i in range(0, len(articles), batch_size)]
+    batch_results = await asyncio.gather(
+        *[_one_batch(b) for b in batches], return_exceptions=True
+    )
+
+    results = []
+    for batch, result in zip(batches, batch_results):
+        if isinstance(result, Exception):
+            results.extend([result] * len(batch))
+        else:
+            results.extend(result)
+    return results
+
+async def _fetch_all_sources():
+    """Run every FETCHERS entry concurrently; per-source exceptions come
+    back as values so one failing source doesn't cancel the others"""
+    return await asyncio.gather(
+        *[asyncio.to_thread(fetcher) for _, fetcher in FETCHERS],
+        return_exceptions=True,
+    )
+
+def _store_articles(articles):
+    """Cache fetched articles plus the derived source dropdown options,
+    so the options aren't rebuilt and re-sorted on every rerun"""
+    st.session_state.articles_cache = articles
+    st.session_state.source_options = ["All"] + sorted(
+        {a.get('source', 'Unknown') for a in articles}
+    )
 
+def _queue_alerts(articles):
+    """Queue alert delivery on the background loop without blocking the rerun"""
+    from telegram_alerts import send_automatic_alerts
+    st.session_state.pending_alerts = asyncio.run_coroutine_threadsafe(
+        send_automatic_alerts(articles), _background_loop()
+    )
+
+# Cached raw-source fetches - repeated reruns within the TTL reuse the
+# in-memory result instead of re-hitting the RSS/NewsAPI endpoints
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_rss_articles():
+    return fetch_news_live()
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_newsapi_articles():
+    return fetch_newsapi_articles_live()
+
+# Article sources as a (label, fetcher) table - the fetch fanout iterates
+# this, so adding a source is a one-line change
+FETCHERS = [
+    ("RSS", _cached_rss_articles),
+    ("NewsAPI", _cached_newsapi_articles),
+]
+
+# Debug output (fetch log expander) is only emitted when this is set -
+# production reruns skip building those widgets entirely
+DEBUG = os.getenv('CRUDEINTEL_DEBUG', '').lower() in ('1', 'true', 'yes')
+
+# Env vars don't change mid-run, so resolve bot-token presence once at
+# import instead of three os.getenv lookups per rerun
+BOT_PRESENT = [
+    (name, bool(os.getenv(env_var)))
+    for name, env_var in [
+        ("Bot 1", "TELEGRAM_BOT_TOKEN_1"),
+        ("Bot 2", "TELEGRAM_BOT_TOKEN_2"),
+        ("Bot 3", "TELEGRAM_BOT_TOKEN_3"),
+    ]
+]
+
+@st.cache_data(ttl=5, show_spinner=False)
+def _cached_alert_stats():
+    """Alert stats for the sidebar, memoized briefly so every rerun
+    doesn't re-count the alert cache"""
+    from telegram_alerts import get_alert_stats
+    return get_alert_stats()
+
+# Sentiment interning: small int codes stored at ingest turn the hot
+# stats/render loops into integer compares (0 = unanalyzed/pending)
+_SENT_CODES = {'Bullish': 1, 'Bearish': 2, 'Neutral': 3}
+_SENT_EMOJI = ('⚪', '🟢', '🔴', '⚪')  # indexed by sentiment code
+
+def _age(seconds):
+    """Human-readable age string for an age in seconds"""
+    if seconds >= 86400:
+        days = seconds // 86400
+        return f"{days} day{'s' if days != 1 else ''} ago"
+    if seconds >= 3600:
+        hours = seconds // 3600
+        return f"{hours} hour{'s' if hours != 1 else ''} ago"
+    return f"{max(1, seconds // 60)}min ago"
+
+@st.cache_data(ttl=900, show_spinner="🔄 Fetching & analyzing crude oil news...")
 def fetch_and_analyze_news():
-    """Fetch news and analyze with AI - only last 1 hour"""
-    with st.spinner("🔄 Fetching latest crude oil news (last 1 hour)..."):
-        all_articles = []
-        
-        # Fetch from RSS sources
-        st.write("📡 Fetching RSS sources...")
-        try:
-            rss_articles = fetch_news_live()
-            all_articles.extend(rss_articles)
-            st.write(f"📰 RSS: {len(rss_articles)} articles")
-        except Exception as e:
-            st.error(f"RSS fetch error: {e}")
-        
-        # Fetch from NewsAPI
-        st.write("📡 Fetching NewsAPI...")
-        try:
-            api_articles = fetch_newsapi_articles_live()
-            all_articles.extend(api_articles)
-            st.write(f"📰 NewsAPI: {len(api_articles)} articles")
-        except Exception as e:
-            st.error(f"NewsAPI fetch error: {e}")
-        
-        # Filter to last 1 hour only
-        recent_articles = filter_last_hour_articles(all_articles)
-        st.write(f"⏰ Recent (last 3 hour): {len(recent_articles)} articles")
-        
-        # Remove duplicates
-        unique_articles = {}
-        for article in recent_articles:
-            article_key = article.get('title', '') + article.get('link', '')
-            if article_key not in unique_articles:
-                unique_articles[article_key] = article
-        
-        final_articles = list(unique_articles.values())
-        st.write(f"📊 Unique articles: {len(final_articles)}")
-        
-        # AI Analysis
-        if final_articles:
-            with st.spinner("🤖 Analyzing with Gemini AI..."):
-                analyzed_count = 0
-                for i, article in enumerate(final_articles):
-                    try:
-                        if i % 3 == 0:
-                            st.write(f"🧠 Analyzing {i+1}/{len(final_articles)}...")
-                        
-                        summary, sentiment = analyze_article_live(
-                            article.get('title', ''),
-                            article.get('description', '')
-                        )
-                        
-                        if summary and sentiment:
-                            article['summary'] = summary
-                            article['sentiment'] = sentiment
-                            analyzed_count += 1
-                        
-                    except Exception as e:
-                        st.write(f"AI error for article {i+1}: {e}")
-                        continue
-                
-                st.write(f"🤖 AI Analysis: {analyzed_count} articles processed")
-        
-        return final_articles
+    """Fetch news and analyze with AI - only last 1 hour.
+
+    Memoized for 15 minutes, which replaces the old hand-rolled
+    last_fetch_time TTL bookkeeping. Widgets aren't allowed inside
+    cache_data, so the pipeline returns (articles, log lines) and the
+    caller renders the log.
+    """
+    log = []
+    all_articles = []
+
+    # Fetch RSS and NewsAPI concurrently - elapsed time becomes the
+    # slower of the two sources instead of the sum
+    log.append("📡 Fetching RSS + NewsAPI sources...")
+    results = asyncio.run_coroutine_threadsafe(
+        _fetch_all_sources(), _background_loop()
+    ).result()
+    for (source_name, _), result in zip(FETCHERS, results):
+        if isinstance(result, Exception):
+            log.append(f"❌ {source_name} fetch error: {result}")
+        else:
+            all_articles.extend(result)
+            log.append(f"📰 {source_name}: {len(result)} articles")
+
+    # Parse published_at once per article and cache it on the dict;
+    # the filter, sort and display code all reuse _pub_dt
+    for article in all_articles:
+        pub_dt = safe_parse_dt(article.get('published_at', ''))
+        article['_pub_dt'] = pub_dt
+        # Epoch seconds alongside the datetime: the filter and sort
+        # compare plain numbers instead of datetime objects
+        article['_pub_ts'] = int(pub_dt.timestamp()) if pub_dt else 0
+        article['_s'] = 0
+        article['_emoji'] = _SENT_EMOJI[0]
+        article['_alert_note'] = "😐 **No Alert**"
+        # Truncate the description once here rather than per render
+        desc = article.get('description') or ''
+        if len(desc) > 300:
+            desc = desc[:300] + "..."
+        article['_desc'] = desc
+
+    # Filter to last 1 hour only
+    recent_articles = filter_last_hour_articles(all_articles)
+    log.append(f"⏰ Recent (last 1 hour): {len(recent_articles)} articles")
+
+    # Remove duplicates - a (title, link) tuple key avoids the string
+    # concat allocation and the ("ab","c") vs ("a","bc") collision; a
+    # seen-set plus append builds the final list directly instead of
+    # round-tripping through a dict and .values()
+    seen = set()
+    final_articles = []
+    for article in recent_articles:
+        article_key = (article.get('title', ''), article.get('link', ''))
+        if article_key not in seen:
+            seen.add(article_key)
+            final_articles.append(article)
+
+    log.append(f"📊 Unique articles: {len(final_articles)}")
+
+    # AI Analysis - all articles fan out concurrently instead of one
+    # blocking Gemini round-trip at a time
+    if final_articles:
+        # The same headline often arrives from multiple sources with
+        # different links; analyze each normalized title once and share
+        # the result across its duplicates
+        title_groups = {}
+        to_analyze = []
+        for article in final_articles:
+            norm_title = article.get('title', '').lower().strip()
+            if norm_title in title_groups:
+                title_groups[norm_title].append(article)
+            else:
+                title_groups[norm_title] = [article]
+                to_analyze.append(article)
+        if len(to_analyze) < len(final_articles):
+            log.append(
+                f"♻️ Cross-source duplicate headlines: "
+                f"{len(final_articles) - len(to_analyze)} reuse an analysis"
+            )
+
+        results = asyncio.run_coroutine_threadsafe(
+            _analyze_all(to_analyze), _background_loop()
+        ).result()
+
+        analyzed_count = 0
+        for i, (article, result) in enumerate(zip(to_analyze, results)):
+            if isinstance(result, Exception):
+                log.append(f"❌ AI error for article {i+1}: {result}")
+                continue
+            summary, sentiment = result
+            if summary and sentiment:
+                code = _SENT_CODES.get(sentiment, 0)
+                norm_title = article.get('title', '').lower().strip()
+                for dup in title_groups[norm_title]:
+                    dup['summary'] = summary
+                    dup['sentiment'] = sentiment
+                    dup['_s'] = code
+                    # Static per-card strings rendered on every pass are
+                    # built once here; only the age badge stays dynamic
+                    dup['_emoji'] = _SENT_EMOJI[code]
+                    if code in (1, 2):
+                        dup['_alert_note'] = "🚨 **Multi-Bot Alert**"
+                    analyzed_count += 1
+
+        log.append(f"🤖 AI Analysis: {analyzed_count} articles processed")
+
+    # Sort once here (newest first); the render path trusts this order
+    # since filtering preserves it. itemgetter is safe - every article
+    # got a _pub_ts in the ingest loop above - and skips the per-item
+    # Python frame a lambda key would cost
+    final_articles.sort(key=itemgetter('_pub_ts'), reverse=True)
+
+    return final_articles, log
+
+# max_entries bounds the memo: the fingerprint rolls over on every fetch
+# cycle, so without it stale full-list copies would pile up for the life
+# of the server. A handful of entries covers the filter combinations a
+# user flips between within one cycle.
+@st.cache_data(max_entries=16, show_spinner=False)
+def _filtered_view(fingerprint, sentiment_filter, source_filter):
+    """Filtered view of the cached articles, memoized on the filter
+    inputs plus the articles fingerprint. Articles are read from
+    session_state so only the small key tuple is hashed per call;
+    no-op reruns with unchanged filters skip the pass entirely."""
+    articles = st.session_state.articles_cache
+
+    # Apply both filters in a single pass instead of rebuilding the
+    # list once per filter
+    def _keep(a):
+        if sentiment_filter == "Unanalyzed":
+            if a.get('summary'):
+                return False
+        elif sentiment_filter != "All" and a.get('sentiment') != sentiment_filter:
+            return False
+        if source_filter != "All" and a.get('source') != source_filter:
+            return False
+        return True
+
+    # Cached articles are already sorted newest-first at fetch time and
+    # filtering preserves that order; the caller paginates the result
+    return [a for a in articles if _keep(a)]
+
+@st.fragment
+def render_articles():
+    """Render the filter widgets and article list, reading the articles
+    from session_state. Fragment-scoped so
+    changing a filter reruns only this block - the fetch pipeline, stats
+    and sidebar above it aren't re-executed for a filter tweak."""
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        sentiment_filter = st.selectbox(
+            "🎭 Sentiment Filter",
+            ["All", "Bullish", "Bearish", "Neutral", "Unanalyzed"]
+        )
+
+    with col2:
+        source_filter = st.selectbox("📡 Source Filter", st.session_state.source_options)
+
+    with col3:
+        limit = st.selectbox("📊 Show Count", [5, 10, 20, 50], index=1)
+
+    filtered_articles = _filtered_view(
+        st.session_state.get('articles_fingerprint'),
+        sentiment_filter, source_filter,
+    )
+
+    if not filtered_articles:
+        st.info("🔍 No articles match current filters.")
+        return
+
+    # Paginate instead of discarding matches past the limit - only one
+    # page of cards is serialized to the browser per rerun, and page
+    # flips rerun just this fragment
+    total = len(filtered_articles)
+    max_page = (total + limit - 1) // limit
+    if max_page > 1:
+        page = st.number_input("📄 Page", min_value=1, max_value=max_page, value=1)
+    else:
+        page = 1
+    start = (page - 1) * limit
+    filtered_articles = filtered_articles[start:start + limit]
+
+    st.markdown(
+        f"📊 Showing **{start + 1}–{start + len(filtered_articles)}** "
+        f"of **{total}** recent articles"
+    )
+
+    # One clock read per render pass instead of one per article
+    now_ts = int(time.time())
+
+    # Compact table: one st.dataframe component over the websocket
+    # instead of several markdown widgets per card
+    if st.toggle("📋 Compact table view"):
+        import pandas as pd
+        df = pd.DataFrame([
+            {
+                "Title": a.get('title', 'No Title'),
+                "Link": a.get('link', ''),
+                "Sentiment": f"{a.get('_emoji', '⚪')} {a.get('sentiment', 'Pending')}",
+                "Summary": a.get('summary') or a.get('_desc', ''),
+                "Source": a.get('source', 'Unknown'),
+                "Age": _age(now_ts - a['_pub_ts']) if a.get('_pub_ts') else "Recent",
+            }
+            for a in filtered_articles
+        ])
+        st.dataframe(
+            df,
+            column_config={"Link": st.column_config.LinkColumn("Link", display_text="open")},
+            hide_index=True,
+            use_container_width=True,
+        )
+        return
+
+    for i, article in enumerate(filtered_articles):
+        title = article.get('title', 'No Title')
+        link = article.get('link', '#')
+        sentiment = article.get('sentiment', 'Pending')
+        summary = article.get('summary', '')
+        description = article.get('_desc', article.get('description', ''))
+        source = article.get('source', 'Unknown')
+
+        # Time since published - integer subtract on the cached epoch
+        pub_ts = article.get('_pub_ts', 0)
+        if pub_ts:
+            time_badge = f"🕒 {_age(now_ts - pub_ts)}"
+        else:
+            time_badge = "🕒 Recent"
+
+        emoji = article.get('_emoji', _SENT_EMOJI[0])
+
+        with st.container():
+            if i > 0:
+                st.markdown("---")
+
+            # One markdown row per card instead of two st.columns layouts
+            if link and link != '#':
+                st.markdown(f"### [{title}]({link}) {time_badge} — {emoji} **{sentiment}**")
+            else:
+                st.markdown(f"### {title} {time_badge} — {emoji} **{sentiment}**")
+
+            if summary:
+                st.markdown(f"**🤖 AI Summary:** {summary}")
+            elif description:
+                st.markdown(f"**📝 Description:** {description}")
+
+            alert_note = article.get('_alert_note', "😐 **No Alert**")
+            st.caption(f"📡 **Source:** {source} &nbsp;•&nbsp; {alert_note}")
+
+@st.fragment(run_every=60)
+def _updated_clock():
+    """Tick the header timestamp without re-running the whole page"""
+    st.caption(f"Updated: {datetime.now().strftime('%H:%M:%S')}")
 
 # Title and header
 st.title("🛢️ CrudeIntel 2.0 Multi-Bot Enhanced")
 st.markdown("**Real-time Crude Oil Intelligence - Multi-Bot Telegram Alerts**")
 
+# Single wall-clock read shared by the rest of this rerun
+NOW = datetime.now(timezone.utc)
+
 # Enhanced status
 col1, col2, col3, col4 = st.columns([2, 1, 1, 1])
 with col1:
@@ -126,10 +445,10 @@ with col1:
 with col2:
     st.success("🟢 Live Mode")
 with col3:
-    cutoff = datetime.now(timezone.utc) - timedelta(hours=1)
+    cutoff = NOW - timedelta(hours=1)
     st.info(f"⏰ Since {cutoff.strftime('%H:%M UTC')}")
 with col4:
-    st.caption(f"Updated: {datetime.now().strftime('%H:%M:%S')}")
+    _updated_clock()
 
 # Sidebar controls
 st.sidebar.header("🎛️ Multi-Bot Controls")
@@ -141,33 +460,48 @@ st.session_state.auto_alerts_enabled = st.sidebar.checkbox(
     help="Automatically send alerts to all configured Telegram bots for Bullish/Bearish news"
 )
 
-# Manual fetch and alert button
+# Manual fetch and alert button: force-refresh by clearing the caches,
+# then let the shared load path below fetch and queue alerts
 if st.sidebar.button("🔄 Fetch & Send Multi-Bot Alerts"):
-    articles = fetch_and_analyze_news()
-    st.session_state.articles_cache = articles
-    st.session_state.last_fetch_time = datetime.now()
-    
-    # Send automatic alerts if enabled
-    if st.session_state.auto_alerts_enabled and articles:
-        with st.spinner("📱 Sending multi-bot alerts..."):
-            alerts_sent = asyncio.run(send_automatic_alerts(articles))
-            if alerts_sent > 0:
-                st.sidebar.success(f"📱 Sent {alerts_sent} alerts across all bots!")
-            else:
-                st.sidebar.info("📱 No alerts needed (neutral/old articles)")
+    _cached_rss_articles.clear()
+    _cached_newsapi_articles.clear()
+    fetch_and_analyze_news.clear()
 
 # Manual test alert to all bots
 if st.sidebar.button("🧪 Test All Bots"):
-    with st.spinner("📱 Testing all telegram bots..."):
-        success = asyncio.run(send_test_alert())
-        if success:
+    from telegram_alerts import send_test_alert
+    st.session_state.pending_test = asyncio.run_coroutine_threadsafe(
+        send_test_alert(), _background_loop()
+    )
+    st.sidebar.info("📱 Test alerts queued for all configured bots")
+
+# Report delivery status of queued background sends
+pending = st.session_state.pending_alerts
+if pending is not None and pending.done():
+    try:
+        alerts_sent = pending.result()
+        if alerts_sent > 0:
+            st.sidebar.success(f"📱 Sent {alerts_sent} alerts across all bots!")
+        else:
+            st.sidebar.info("📱 No alerts needed (neutral/old articles)")
+    except Exception as e:
+        st.sidebar.error(f"Alert delivery error: {e}")
+    st.session_state.pending_alerts = None
+
+pending_test = st.session_state.pending_test
+if pending_test is not None and pending_test.done():
+    try:
+        if pending_test.result():
             st.sidebar.success("✅ Test alerts sent to all configured bots!")
         else:
             st.sidebar.error("❌ Some or all test alerts failed")
+    except Exception as e:
+        st.sidebar.error(f"Test alert error: {e}")
+    st.session_state.pending_test = None
 
 # Enhanced Alert statistics with multi-bot info
 try:
-    alert_stats = get_alert_stats()
+    alert_stats = _cached_alert_stats()
     st.sidebar.markdown("---")
     st.sidebar.markdown("### 📊 Multi-Bot Alert Stats")
     st.sidebar.caption(f"• Total alerted: {alert_stats['total_alerted']}")
@@ -183,56 +517,56 @@ try:
 except Exception as e:
     st.sidebar.error(f"Stats error: {e}")
 
-# Auto-fetch on page load (controlled, only once per session or every 15 minutes)
-current_time = datetime.now()
-should_auto_fetch = False
-
-if not st.session_state.articles_cache:
-    should_auto_fetch = True
-    reason = "No cached articles"
-elif not st.session_state.last_fetch_time:
-    should_auto_fetch = True
-    reason = "No previous fetch time"
-elif (current_time - st.session_state.last_fetch_time).total_seconds() > 900:  # 15 minutes
-    should_auto_fetch = True
-    reason = "Cache expired (15+ minutes old)"
-
-if should_auto_fetch:
-    st.info(f"🔄 Auto-fetching latest news ({reason})...")
-    articles = fetch_and_analyze_news()
-    st.session_state.articles_cache = articles
-    st.session_state.last_fetch_time = current_time
-    
-    # Auto-send multi-bot alerts if enabled
+# Load articles: st.cache_data(ttl=900) handles the 15-minute refresh
+# cadence, so reruns inside the TTL reuse the memoized pipeline result
+articles, fetch_log = fetch_and_analyze_news()
+
+if DEBUG:
+    with st.expander("🔍 Fetch log", expanded=False):
+        st.code("\n".join(fetch_log))
+
+# Detect a fresh fetch (vs a cache hit) by fingerprinting the article
+# links; only then refresh derived state and queue alerts
+fingerprint = tuple(a.get('link', '') for a in articles)
+if fingerprint != st.session_state.get('articles_fingerprint'):
+    st.session_state.articles_fingerprint = fingerprint
+    _store_articles(articles)
+    st.session_state.last_fetch_time = datetime.now()
+
     if st.session_state.auto_alerts_enabled and articles:
         try:
-            alerts_sent = asyncio.run(send_automatic_alerts(articles))
-            if alerts_sent > 0:
-                st.success(f"📱 Auto-sent {alerts_sent} alerts to all configured bots!")
+            _queue_alerts(articles)
+            st.info("📱 Multi-bot alerts queued for all configured bots")
         except Exception as e:
             st.error(f"Auto-alert error: {e}")
 
-# Get articles from cache
-articles = st.session_state.articles_cache
-
 # Enhanced statistics
 if articles:
+    # Single pass over articles for all statistics instead of one
+    # list comprehension per metric
+    analyzed = bullish = bearish = 0
+    for article in articles:
+        if article.get('summary'):
+            analyzed += 1
+        code = article.get('_s', 0)
+        if code == 1:
+            bullish += 1
+        elif code == 2:
+            bearish += 1
+    alertable = bullish + bearish
+
     col1, col2, col3, col4 = st.columns(4)
-    
+
     with col1:
         st.metric("📰 Last Hour Articles", len(articles))
-    
+
     with col2:
-        analyzed = len([a for a in articles if a.get('summary')])
         st.metric("🤖 AI Analyzed", analyzed)
-    
+
     with col3:
-        alertable = len([a for a in articles if a.get('sentiment') in ['Bullish', 'Bearish']])
         st.metric("🚨 Multi-Bot Ready", alertable)
-    
+
     with col4:
-        bullish = len([a for a in articles if a.get('sentiment') == 'Bullish'])
-        bearish = len([a for a in articles if a.get('sentiment') == 'Bearish'])
         if bullish > bearish:
             st.metric("📊 Hourly Mood", "🟢 Bullish", bullish)
         elif bearish > bullish:
@@ -240,103 +574,9 @@ if articles:
         else:
             st.metric("📊 Hourly Mood", "⚪ Balanced", "Even")
 
-    # Enhanced filters
+    # Filters + article display (fragment-scoped)
     st.subheader("📰 Latest Hour Intelligence")
-    
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        sentiment_filter = st.selectbox(
-            "🎭 Sentiment Filter",
-            ["All", "Bullish", "Bearish", "Neutral", "Unanalyzed"]
-        )
-    
-    with col2:
-        sources = ["All"] + sorted(list(set([a.get('source', 'Unknown') for a in articles])))
-        source_filter = st.selectbox("📡 Source Filter", sources)
-    
-    with col3:
-        limit = st.selectbox("📊 Show Count", [5, 10, 20, 50], index=1)
-    
-    # Apply filters
-    filtered_articles = articles
-    
-    if sentiment_filter != "All":
-        if sentiment_filter == "Unanalyzed":
-            filtered_articles = [a for a in filtered_articles if not a.get('summary')]
-        else:
-            filtered_articles = [a for a in filtered_articles if a.get('sentiment') == sentiment_filter]
-    
-    if source_filter != "All":
-        filtered_articles = [a for a in filtered_articles if a.get('source') == source_filter]
-    
-    # Sort by published date (newest first)
-    try:
-        filtered_articles = sorted(filtered_articles, 
-                                 key=lambda x: datetime.fromisoformat(x.get('published_at', '1970-01-01T00:00:00Z').replace('Z', '+00:00')), 
-                                 reverse=True)
-    except:
-        pass
-    
-    filtered_articles = filtered_articles[:limit]
-    
-    # Enhanced article display
-    if filtered_articles:
-        st.markdown(f"📊 Showing **{len(filtered_articles)}** recent articles")
-        
-        for i, article in enumerate(filtered_articles):
-            title = article.get('title', 'No Title')
-            link = article.get('link', '#')
-            sentiment = article.get('sentiment', 'Pending')
-            summary = article.get('summary', '')
-            description = article.get('description', '')
-            source = article.get('source', 'Unknown')
-            published_at = article.get('published_at', 'Unknown')
-            
-            # Time since published
-            try:
-                pub_dt = datetime.fromisoformat(published_at.replace('Z', '+00:00'))
-                time_ago = datetime.now(timezone.utc) - pub_dt
-                minutes_ago = max(1, int(time_ago.total_seconds() / 60))
-                time_badge = f"🕒 {minutes_ago}min ago"
-            except:
-                time_badge = "🕒 Recent"
-            
-            sentiment_emoji = {'Bullish': '🟢', 'Bearish': '🔴', 'Neutral': '⚪'}
-            emoji = sentiment_emoji.get(sentiment, '⚪')
-            
-            with st.container():
-                if i > 0:
-                    st.markdown("---")
-                
-                col1, col2 = st.columns([5, 1])
-                
-                with col1:
-                    if link and link != '#':
-                        st.markdown(f"### [{title}]({link}) {time_badge}")
-                    else:
-                        st.markdown(f"### {title} {time_badge}")
-                
-                with col2:
-                    st.markdown(f"## {emoji} {sentiment}")
-                
-                if summary:
-                    st.markdown(f"**🤖 AI Summary:** {summary}")
-                elif description:
-                    if len(description) > 300:
-                        description = description[:300] + "..."
-                    st.markdown(f"**📝 Description:** {description}")
-                
-                col1, col2 = st.columns([3, 1])
-                with col1:
-                    st.caption(f"📡 **Source:** {source}")
-                with col2:
-                    if sentiment in ['Bullish', 'Bearish']:
-                        st.caption("🚨 **Multi-Bot Alert**")
-                    else:
-                        st.caption("😐 **No Alert**")
-    else:
-        st.info("🔍 No articles match current filters.")
+    render_articles()
 
 else:
     st.info("🔄 No recent articles found. Click 'Fetch & Send Multi-Bot Alerts' to load fresh news!")
@@ -349,16 +589,10 @@ if st.session_state.last_fetch_time:
     st.sidebar.caption(f"• Last fetch: {cache_age:.1f} min ago")
     st.sidebar.caption(f"• Articles cached: {len(st.session_state.articles_cache)}")
     
-    # Show environment status
-    bot_tokens = [
-        ("Bot 1", "TELEGRAM_BOT_TOKEN_1"),
-        ("Bot 2", "TELEGRAM_BOT_TOKEN_2"), 
-        ("Bot 3", "TELEGRAM_BOT_TOKEN_3")
-    ]
-    
+    # Show environment status (resolved once at import)
     st.sidebar.markdown("### 🤖 Bot Status")
-    for bot_name, env_var in bot_tokens:
-        if os.getenv(env_var):
+    for bot_name, present in BOT_PRESENT:
+        if present:
             st.sidebar.caption(f"• {bot_name}: ✅ Configured")
         else:
             st.sidebar.caption(f"• {bot_name}: ❌ Missing")
@@ -4,46 +4,95 @@ CrudeIntel 2.0 Automated Alerts for Render Scheduled Job (15-minute run)
 """
 
 import asyncio
+import logging
 import sys
 import os
-from datetime import datetime, timezone, timedelta
+from datetime import datetime, timezone
 
 # Ensure current folder is in path for imports
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+# Root handler for the module loggers (fetchers, database) - without one
+# their INFO/DEBUG lines are dropped and only WARNING+ reaches stderr
+logging.basicConfig(
+    level=getattr(logging, os.getenv('LOG_LEVEL', 'INFO').upper(), logging.INFO),
+    format='%(asctime)s %(levelname)s %(name)s: %(message)s',
+)
+
 from news_fetcher import fetch_news_live
 from newsapi_fetcher import fetch_newsapi_articles_live
 from summarizer import analyze_article_live
 from telegram_alerts import send_automatic_alerts
+from pipeline import filter_last_hour_articles, dedup_key
+
+async def analyze_and_alert(articles, max_concurrency=8):
+    """Overlap Gemini analysis with Telegram delivery.
 
-def filter_last_hour_articles(articles):
-    """Keep only articles published within last hour."""
-    cutoff = datetime.now(timezone.utc) - timedelta(hours=1)
-    recent = []
-    for article in articles:
-        try:
-            published_at = article.get('published_at', '')
-            if not published_at:
-                continue
-            published_dt = datetime.fromisoformat(published_at.replace('Z', '+00:00'))
-            if published_dt > cutoff:
-                recent.append(article)
-        except Exception as e:
-            print(f"Date parse error: {e}")
-    return recent
+    Analyses fan out concurrently (semaphore-capped) and push each
+    finished article onto a queue; the consumer starts sending alerts as
+    soon as the first article is analyzed instead of waiting for the
+    whole batch. Total wall time approaches the slower of the two phases
+    rather than their sum. Returns (analyzed_count, alerts_sent).
+    """
+    queue = asyncio.Queue()
+    sem = asyncio.Semaphore(max_concurrency)
+    analyzed_count = 0
+
+    async def _analyze_one(article):
+        nonlocal analyzed_count
+        async with sem:
+            try:
+                summary, sentiment = await asyncio.to_thread(
+                    analyze_article_live,
+                    article.get('title', ''),
+                    article.get('description', ''),
+                )
+                article['summary'] = summary
+                article['sentiment'] = sentiment
+                analyzed_count += 1
+            except Exception as e:
+                print(f"AI analysis error: {e}")
+        await queue.put(article)
+
+    async def _producer():
+        await asyncio.gather(*[_analyze_one(a) for a in articles])
+        await queue.put(None)  # sentinel: no more articles coming
+
+    async def _consumer():
+        alerts_sent = 0
+        while True:
+            article = await queue.get()
+            if article is None:
+                break
+            alerts_sent += await send_automatic_alerts([article])
+        return alerts_sent
+
+    producer = asyncio.create_task(_producer())
+    alerts_sent = await _consumer()
+    await producer
+    return analyzed_count, alerts_sent
 
 async def main():
     print(f"CrudeIntel Auto Alert Job started at {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}")
     
     try:
-        print("Fetching RSS Feed Articles...")
-        rss_articles = fetch_news_live()
-        print(f"Fetched {len(rss_articles)} RSS articles")
-        
-        print("Fetching NewsAPI Articles...")
-        newsapi_articles = fetch_newsapi_articles_live()
-        print(f"Fetched {len(newsapi_articles)} NewsAPI articles")
-        
+        # Fetch both sources concurrently - the run waits for the slower
+        # one instead of the sum, and one source failing doesn't abort
+        # the other
+        print("Fetching RSS + NewsAPI articles concurrently...")
+        rss_articles, newsapi_articles = await asyncio.gather(
+            asyncio.to_thread(fetch_news_live),
+            asyncio.to_thread(fetch_newsapi_articles_live),
+            return_exceptions=True,
+        )
+        if isinstance(rss_articles, Exception):
+            print(f"RSS fetch error: {rss_articles}")
+            rss_articles = []
+        if isinstance(newsapi_articles, Exception):
+            print(f"NewsAPI fetch error: {newsapi_articles}")
+            newsapi_articles = []
+        print(f"Fetched {len(rss_articles)} RSS + {len(newsapi_articles)} NewsAPI articles")
+
         all_articles = rss_articles + newsapi_articles
         
         # Filter to last one hour only
@@ -54,34 +103,23 @@ async def main():
             print("No recent articles to send alerts for.")
             return
         
-        # Deduplicate articles by title + link
+        # Deduplicate by canonical-link hash: catches the same story
+        # under tracking-param URL variants without the per-article
+        # title+link string concat
         unique = {}
         for article in recent_articles:
-            key = article.get('title', '') + article.get('link', '')
+            key = dedup_key(article)
             if key not in unique:
                 unique[key] = article
-        
+
         unique_articles = list(unique.values())
         print(f"{len(unique_articles)} unique recent articles")
         
-        # AI Analyze articles
-        print("Running AI analysis on articles...")
-        analyzed_count = 0
-        for i, article in enumerate(unique_articles):
-            try:
-                print(f"Analyzing article {i+1}/{len(unique_articles)}: {article.get('title', '')[:50]}")
-                summary, sentiment = analyze_article_live(article.get('title', ''), article.get('description', ''))
-                article['summary'] = summary
-                article['sentiment'] = sentiment
-                analyzed_count += 1
-            except Exception as e:
-                print(f"AI analysis error: {e}")
-        
+        # AI analysis and Telegram alerts run interleaved: each article
+        # is alerted as soon as its sentiment is known
+        print("Running AI analysis with interleaved alert delivery...")
+        analyzed_count, alerts_sent = await analyze_and_alert(unique_articles)
         print(f"Analyzed {analyzed_count} articles")
-        
-        # Send Telegram alerts for articles
-        print("Sending Telegram alerts for relevant articles...")
-        alerts_sent = await send_automatic_alerts(unique_articles)
         print(f"Sent {alerts_sent} alerts")
     
     except Exception as e:
@@ -1,14 +1,66 @@
 import os
+import logging
 import requests
 import json
 import hashlib
+import threading
+import time
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import List, Dict
 
+# orjson (de)serializes several times faster than stdlib json, which
+# matters for the large get_recent_articles payloads; fall back to the
+# stdlib when it isn't installed
+try:
+    import orjson
+    _json_dumps = orjson.dumps  # returns bytes
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj):
+        return json.dumps(obj).encode()
+    _json_loads = json.loads
+
+# Module logger: level comes from the environment so production runs can
+# silence the per-row diagnostics that used to be print() calls. The %s
+# lazy formatting means disabled levels skip the string work entirely.
+# getattr with a fallback tolerates lowercase/invalid LOG_LEVEL values;
+# the entrypoints (app.py, auto_alerts.py) configure the handler.
+log = logging.getLogger(__name__)
+log.setLevel(getattr(logging, os.getenv('LOG_LEVEL', 'INFO').upper(), logging.INFO))
+
 # Firebase configuration
 FIREBASE_PROJECT_ID = os.getenv('FIREBASE_PROJECT_ID')
 FIREBASE_API_KEY = os.getenv('FIREBASE_API_KEY')
 
+# One session for all Firestore calls: keep-alive reuses the TLS
+# connection across requests instead of a full handshake per call, and
+# the adapter retries transient Firestore errors with backoff
+_session = requests.Session()
+_session.headers.update({'Content-Type': 'application/json'})
+_session.mount('https://', requests.adapters.HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=requests.adapters.Retry(
+        total=3, backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504]),
+))
+
+# Doc ids known to exist in Firestore, fed by successful inserts and
+# existence checks. Feeds repeat most links for hours, so the common
+# case resolves from this set with zero network I/O.
+_KNOWN_IDS = set()
+
+@lru_cache(maxsize=4096)
+def _doc_id(link: str) -> str:
+    """Deterministic Firestore doc id for a link.
+
+    Stays md5 so ids keep matching documents already stored; the
+    lru_cache means a link crossing several helpers (existence check,
+    insert, alert marking) is hashed once per process.
+    """
+    return hashlib.md5(link.encode()).hexdigest()
+
 def get_firestore_url(collection: str, document_id: str = None):
     """Generate Firestore REST API URL with API key"""
     base_url = f"https://firestore.googleapis.com/v1/projects/{FIREBASE_PROJECT_ID}/databases/(default)/documents/{collection}"
@@ -19,21 +71,19 @@ def get_firestore_url(collection: str, document_id: str = None):
 
 def make_firestore_request(method: str, url: str, data: Dict = None) -> Dict:
     """Make request to Firestore REST API"""
-    headers = {'Content-Type': 'application/json'}
-    
     try:
         if method == 'GET':
-            response = requests.get(url, headers=headers, timeout=10)
+            response = _session.get(url, timeout=10)
         elif method == 'POST':
-            response = requests.post(url, headers=headers, json=data, timeout=10)
+            response = _session.post(url, data=_json_dumps(data), timeout=10)
         elif method == 'PATCH':
-            response = requests.patch(url, headers=headers, json=data, timeout=10)
-        
+            response = _session.patch(url, data=_json_dumps(data), timeout=10)
+
         response.raise_for_status()
-        return response.json() if response.content else {}
-        
+        return _json_loads(response.content) if response.content else {}
+
     except requests.exceptions.RequestException as e:
-        print(f"❌ Firestore API error: {e}")
+        log.error("❌ Firestore API error: %s", e)
         return {}
 
 def firestore_value(value):
@@ -47,106 +97,328 @@ def firestore_value(value):
     else:
         return {"stringValue": str(value)}
 
+# Firestore wraps each field in a one-key {typeTag: value} object;
+# dispatch on that tag instead of probing with chained membership tests
+_PARSERS = {
+    'stringValue': lambda v: v,
+    'booleanValue': lambda v: v,
+    'nullValue': lambda v: None,
+}
+
 def parse_firestore_doc(doc: Dict) -> Dict:
     """Parse Firestore document to Python dict"""
     if not doc or 'fields' not in doc:
         return {}
-    
+
     result = {}
     for key, value_obj in doc['fields'].items():
-        if 'stringValue' in value_obj:
-            result[key] = value_obj['stringValue']
-        elif 'booleanValue' in value_obj:
-            result[key] = value_obj['booleanValue']
-        elif 'nullValue' in value_obj:
-            result[key] = None
-        else:
-            result[key] = str(value_obj)
-    
+        value_type = next(iter(value_obj))
+        result[key] = _PARSERS.get(value_type, str)(value_obj[value_type])
+
     if 'name' in doc:
-        result['id'] = doc['name'].split('/')[-1]
-    
+        result['id'] = doc['name'].rsplit('/', 1)[-1]
+
     return result
 
-def insert_article(title: str, description: str, source: str, link: str, 
+def insert_article(title: str, description: str, source: str, link: str,
                   published_at: str, summary: str = None, sentiment: str = None) -> bool:
-    """Insert article into Firestore"""
+    """Insert a single article (thin wrapper over insert_articles_batch)"""
+    log.debug("💾 Inserting article '%.50s...' from %s", title, source)
+    return insert_articles_batch([{
+        'title': title,
+        'description': description,
+        'source': source,
+        'link': link,
+        'published_at': published_at,
+        'summary': summary,
+        'sentiment': sentiment,
+    }]) == 1
+
+def _doc_name(doc_id: str) -> str:
+    """Full Firestore resource name for an articles doc"""
+    return f"projects/{FIREBASE_PROJECT_ID}/databases/(default)/documents/articles/{doc_id}"
+
+def _article_fields(article: Dict) -> Dict:
+    """Build the Firestore fields payload insert_article writes"""
+    return {
+        "title": firestore_value(article.get('title')),
+        "description": firestore_value(article.get('description')),
+        "source": firestore_value(article.get('source')),
+        "link": firestore_value(article.get('link')),
+        "published_at": firestore_value(article.get('published_at')),
+        "summary": firestore_value(article.get('summary')),
+        "sentiment": firestore_value(article.get('sentiment')),
+        "alerted": firestore_value(article.get('alerted', False)),
+        "created_at": firestore_value(datetime.now(timezone.utc).isoformat())
+    }
+
+def insert_articles_batch(articles: List[Dict]) -> int:
+    """Upsert many articles with :batchWrite instead of one PATCH each.
+
+    Returns the number of successful writes. Firestore accepts up to 500
+    writes per batchWrite call, so larger inputs are chunked.
+    """
+    if not articles:
+        return 0
+
+    written = 0
     try:
-        print(f"💾 DEBUG: Inserting article '{title[:50]}...' from {source}")
-        
-        doc_id = hashlib.md5(link.encode()).hexdigest()
-        
-        doc_data = {
-            "fields": {
-                "title": firestore_value(title),
-                "description": firestore_value(description),
-                "source": firestore_value(source),
-                "link": firestore_value(link),
-                "published_at": firestore_value(published_at),
-                "summary": firestore_value(summary),
-                "sentiment": firestore_value(sentiment),
-                "alerted": firestore_value(False),
-                "created_at": firestore_value(datetime.now(timezone.utc).isoformat())
-            }
-        }
-        
-        url = get_firestore_url("articles", doc_id)
-        result = make_firestore_request("PATCH", url, doc_data)
-        
-        if result and 'name' in result:
-            print(f"✅ Insert succeeded")
-            return True
-        else:
-            print(f"❌ Insert failed")
-            return False
-            
+        url = f"https://firestore.googleapis.com/v1/projects/{FIREBASE_PROJECT_ID}/databases/(default)/documents:batchWrite?key={FIREBASE_API_KEY}"
+
+        for start in range(0, len(articles), 500):
+            chunk = articles[start:start + 500]
+            writes = [
+                {
+                    "update": {
+                        "name": _doc_name(_doc_id(article.get('link', ''))),
+                        "fields": _article_fields(article)
+                    }
+                }
+                for article in chunk
+            ]
+
+            result = make_firestore_request("POST", url, {"writes": writes})
+            if result:
+                # Per-write status: an empty status (code 0) means OK
+                statuses = result.get('status', [])
+                for article, status in zip(chunk, statuses):
+                    if not status.get('code'):
+                        written += 1
+                        _KNOWN_IDS.add(_doc_id(article.get('link', '')))
+
+        log.debug("💾 Batch insert: %d/%d articles written", written, len(articles))
+        return written
+
     except Exception as e:
-        print(f"❌ Exception during insert: {e}")
-        return False
+        log.error("❌ Exception during insert_articles_batch: %s", e)
+        return written
 
-def get_recent_articles(limit: int = 50) -> List[Dict]:
-    """Get recent articles from Firestore"""
+def mark_articles_alerted_batch(article_ids: List[str]) -> int:
+    """Mark many articles alerted in one :batchWrite call per 500 ids.
+
+    Uses an updateMask so only the alerted flag is touched. Returns the
+    number of successful writes.
+    """
+    if not article_ids:
+        return 0
+
+    written = 0
     try:
-        print(f"📚 DEBUG: Querying Firestore for {limit} articles...")
-        
-        url = get_firestore_url("articles")
-        result = make_firestore_request("GET", url)
-        
-        if not result or 'documents' not in result:
-            print(f"📚 No articles found")
-            return []
-        
-        articles = []
-        for doc in result['documents']:
+        url = f"https://firestore.googleapis.com/v1/projects/{FIREBASE_PROJECT_ID}/databases/(default)/documents:batchWrite?key={FIREBASE_API_KEY}"
+
+        for start in range(0, len(article_ids), 500):
+            chunk = article_ids[start:start + 500]
+            writes = [
+                {
+                    "update": {
+                        "name": _doc_name(article_id),
+                        "fields": {"alerted": firestore_value(True)}
+                    },
+                    "updateMask": {"fieldPaths": ["alerted"]}
+                }
+                for article_id in chunk
+            ]
+
+            result = make_firestore_request("POST", url, {"writes": writes})
+            if result:
+                statuses = result.get('status', [])
+                written += sum(1 for s in statuses if not s.get('code'))
+
+        return written
+
+    except Exception as e:
+        log.error("❌ Exception during mark_articles_alerted_batch: %s", e)
+        return written
+
+# Short-TTL memo for get_recent_articles keyed by limit. Within the TTL
+# repeat callers get the in-memory list; past it, only articles newer
+# than the cached head are queried and merged. The delta can't see
+# backfilled articles (published minutes before they hit the feed) or
+# in-place field updates on cached rows, so a full re-query runs once
+# the last full fetch is older than _RECENT_FULL_MAX_AGE.
+_RECENT_TTL = 30
+_RECENT_FULL_MAX_AGE = 300
+_recent_cache = {}  # limit -> (fetched_ts, full_ts, articles)
+_recent_lock = threading.Lock()
+
+def _query_recent(limit: int, since: str = None) -> List[Dict]:
+    """runQuery for the newest articles, optionally only those published
+    at or after `since` (ISO string - compares like the stored field)"""
+    url = f"https://firestore.googleapis.com/v1/projects/{FIREBASE_PROJECT_ID}/databases/(default)/documents:runQuery?key={FIREBASE_API_KEY}"
+    query_data = {
+        "structuredQuery": {
+            "from": [{"collectionId": "articles"}],
+            "orderBy": [
+                {"field": {"fieldPath": "published_at"}, "direction": "DESCENDING"}
+            ],
+            "limit": limit
+        }
+    }
+    if since:
+        query_data["structuredQuery"]["where"] = {
+            "fieldFilter": {
+                "field": {"fieldPath": "published_at"},
+                "op": "GREATER_THAN_OR_EQUAL",
+                "value": {"stringValue": since}
+            }
+        }
+
+    result = make_firestore_request("POST", url, query_data)
+
+    articles = []
+    for entry in result or []:
+        doc = entry.get('document') if isinstance(entry, dict) else None
+        if doc:
             article = parse_firestore_doc(doc)
             if article:
                 articles.append(article)
-        
-        # Sort by published_at (newest first)
-        articles.sort(key=lambda x: x.get('published_at', ''), reverse=True)
-        
-        print(f"📚 Retrieved {len(articles)} articles")
-        return articles[:limit]
-        
+    return articles
+
+def get_recent_articles(limit: int = 50) -> List[Dict]:
+    """Get recent articles from Firestore, newest first.
+
+    Server-side orderBy + limit downloads only the requested page
+    already sorted. Results are memoized for 30 seconds per limit. A
+    refresh past the TTL normally asks only for articles at or newer
+    than the cached head - a near-zero delta in the steady state - but
+    falls back to a full page query every _RECENT_FULL_MAX_AGE seconds
+    to pick up backfilled articles and field updates on cached rows.
+    """
+    try:
+        now = time.time()
+        with _recent_lock:
+            cached = _recent_cache.get(limit)
+        if cached and now - cached[0] < _RECENT_TTL:
+            return cached[2]
+
+        log.debug("📚 Querying Firestore for %d articles...", limit)
+
+        last_seen = ''
+        if cached and cached[2] and now - cached[1] < _RECENT_FULL_MAX_AGE:
+            last_seen = cached[2][0].get('published_at', '')
+
+        if last_seen:
+            # Delta fast path: >= catches ties on the head timestamp,
+            # and the link dedup drops the re-fetched head itself
+            fresh = _query_recent(limit, since=last_seen)
+            fresh_links = {a.get('link') for a in fresh}
+            articles = (fresh + [
+                a for a in cached[2] if a.get('link') not in fresh_links
+            ])[:limit]
+            full_ts = cached[1]
+        else:
+            articles = _query_recent(limit)
+            full_ts = now
+
+        with _recent_lock:
+            _recent_cache[limit] = (now, full_ts, articles)
+
+        log.debug("📚 Retrieved %d articles", len(articles))
+        return articles
+
     except Exception as e:
-        print(f"❌ Exception during get_recent_articles: {e}")
+        log.error("❌ Exception during get_recent_articles: %s", e)
         return []
 
 def check_article_exists(link: str) -> bool:
     """Check if article exists"""
     try:
-        doc_id = hashlib.md5(link.encode()).hexdigest()
+        doc_id = _doc_id(link)
+        if doc_id in _KNOWN_IDS:
+            return True
+
         url = get_firestore_url("articles", doc_id)
         result = make_firestore_request("GET", url)
-        
+
         exists = bool(result and 'name' in result)
-        print(f"🔎 Article exists: {exists}")
+        if exists:
+            _KNOWN_IDS.add(doc_id)
+        log.debug("🔎 Article exists: %s", exists)
         return exists
-        
+
     except Exception as e:
-        print(f"❌ Exception during check_article_exists: {e}")
+        log.error("❌ Exception during check_article_exists: %s", e)
         return False
 
+def seed_known_ids(page_size: int = 1000) -> int:
+    """Warm the known-ids set with one name-only list call.
+
+    The field mask keeps the payload to document names, so seeding costs
+    a fraction of a full list. Returns the number of known ids.
+    """
+    try:
+        url = get_firestore_url("articles") + f"&mask.fieldPaths=__name__&pageSize={page_size}"
+        result = make_firestore_request("GET", url)
+        for doc in (result or {}).get('documents', []):
+            _KNOWN_IDS.add(doc.get('name', '').rsplit('/', 1)[-1])
+        log.debug("🔎 Seeded %d known ids", len(_KNOWN_IDS))
+        return len(_KNOWN_IDS)
+    except Exception as e:
+        log.error("❌ Exception during seed_known_ids: %s", e)
+        return len(_KNOWN_IDS)
+
+def check_articles_exist_batch(links: List[str]) -> Dict[str, bool]:
+    """Check many links for existence in one :batchGet round-trip.
+
+    Returns {link: exists}. Doc ids are derived from the link exactly as
+    insert_article does, so a single POST replaces one GET per link.
+    Firestore caps batchGet at 500 documents, so large inputs are chunked.
+    """
+    results = {}
+    if not links:
+        return results
+
+    try:
+        doc_prefix = f"projects/{FIREBASE_PROJECT_ID}/databases/(default)/documents/articles"
+        url = f"https://firestore.googleapis.com/v1/projects/{FIREBASE_PROJECT_ID}/databases/(default)/documents:batchGet?key={FIREBASE_API_KEY}"
+
+        for start in range(0, len(links), 500):
+            chunk = links[start:start + 500]
+
+            # Ids already known to exist skip the query entirely
+            id_to_link = {}
+            for link in chunk:
+                doc_id = _doc_id(link)
+                if doc_id in _KNOWN_IDS:
+                    results[link] = True
+                else:
+                    id_to_link[doc_id] = link
+                    results[link] = False
+            if not id_to_link:
+                continue
+
+            batch_data = {"documents": [f"{doc_prefix}/{doc_id}" for doc_id in id_to_link]}
+            response = make_firestore_request("POST", url, batch_data)
+
+            for entry in response or []:
+                found = entry.get('found')
+                if found and 'name' in found:
+                    doc_id = found['name'].rsplit('/', 1)[-1]
+                    link = id_to_link.get(doc_id)
+                    if link:
+                        results[link] = True
+                        _KNOWN_IDS.add(doc_id)
+
+        log.debug("🔎 Batch existence check: %d/%d already stored", sum(results.values()), len(links))
+        return results
+
+    except Exception as e:
+        log.error("❌ Exception during check_articles_exist_batch: %s", e)
+        return results
+
+def filter_new_links(links: List[str]) -> List[str]:
+    """Return only the links not yet stored, in input order.
+
+    Prefilter for fetch loops: one batchGet round-trip answers every
+    candidate at once, so callers can drop known articles locally and
+    hand the rest to insert_articles_batch - no per-link
+    check_article_exists calls on the hot path.
+    """
+    if not links:
+        return []
+    existing = check_articles_exist_batch(links)
+    return [link for link in links if not existing.get(link)]
+
 def update_article_summary(article_id: str, summary: str, sentiment: str) -> bool:
     """Update article with AI summary"""
     try:
@@ -163,20 +435,66 @@ def update_article_summary(article_id: str, summary: str, sentiment: str) -> boo
         return bool(result and 'name' in result)
         
     except Exception as e:
-        print(f"❌ Exception during update: {e}")
+        log.error("❌ Exception during update: %s", e)
         return False
 
-def get_unalerted_articles() -> List[Dict]:
-    """Get unalerted articles"""
+def get_unalerted_articles(limit: int = 100) -> List[Dict]:
+    """Get unalerted, non-neutral articles via a server-side query.
+
+    A structured :runQuery applies both filters in Firestore, so only
+    matching documents cross the wire instead of a 1000-doc full scan
+    filtered in Python. The inequality field must lead the orderBy per
+    Firestore's query rules.
+    """
     try:
-        all_articles = get_recent_articles(1000)
-        unalerted = [
-            article for article in all_articles 
-            if not article.get('alerted', False) and article.get('sentiment') != 'Neutral'
-        ]
+        url = f"https://firestore.googleapis.com/v1/projects/{FIREBASE_PROJECT_ID}/databases/(default)/documents:runQuery?key={FIREBASE_API_KEY}"
+        query_data = {
+            "structuredQuery": {
+                "from": [{"collectionId": "articles"}],
+                "where": {
+                    "compositeFilter": {
+                        "op": "AND",
+                        "filters": [
+                            {
+                                "fieldFilter": {
+                                    "field": {"fieldPath": "sentiment"},
+                                    "op": "NOT_EQUAL",
+                                    "value": {"stringValue": "Neutral"}
+                                }
+                            },
+                            {
+                                "fieldFilter": {
+                                    "field": {"fieldPath": "alerted"},
+                                    "op": "EQUAL",
+                                    "value": {"booleanValue": False}
+                                }
+                            }
+                        ]
+                    }
+                },
+                "orderBy": [
+                    {"field": {"fieldPath": "sentiment"}},
+                    {"field": {"fieldPath": "published_at"}, "direction": "DESCENDING"}
+                ],
+                "limit": limit
+            }
+        }
+
+        result = make_firestore_request("POST", url, query_data)
+
+        unalerted = []
+        for entry in result or []:
+            doc = entry.get('document') if isinstance(entry, dict) else None
+            if doc:
+                article = parse_firestore_doc(doc)
+                if article:
+                    unalerted.append(article)
+
+        log.debug("📚 Retrieved %d unalerted articles", len(unalerted))
         return unalerted
+
     except Exception as e:
-        print(f"❌ Exception during get_unalerted_articles: {e}")
+        log.error("❌ Exception during get_unalerted_articles: %s", e)
         return []
 
 def mark_article_alerted(article_id: str) -> bool:
@@ -194,7 +512,7 @@ def mark_article_alerted(article_id: str) -> bool:
         return bool(result and 'name' in result)
         
     except Exception as e:
-        print(f"❌ Exception during mark_article_alerted: {e}")
+        log.error("❌ Exception during mark_article_alerted: %s", e)
         return False
 
 def test_database_connection() -> bool:
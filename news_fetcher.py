@@ -1,11 +1,71 @@
 import feedparser
+import json
+import logging
+import os
+import re
 import requests
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime, timezone
 import pytz
 
 # Set timezone for India
 tz = pytz.timezone("Asia/Kolkata")
 
+# Env-gated logger (same convention as database.py): per-entry
+# diagnostics cost a stdout flush each, so they only run at DEBUG
+log = logging.getLogger(__name__)
+log.setLevel(getattr(logging, os.getenv('LOG_LEVEL', 'INFO').upper(), logging.INFO))
+
+# Shared session for all feed fetches: keep-alive reuses the TCP+TLS
+# connection per feed host across cycles, the pool covers every feed,
+# and transient failures retry with backoff instead of dropping a source
+_session = requests.Session()
+_session.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+})
+_session.mount('https://', HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(total=3, backoff_factor=0.3,
+                      status_forcelist=[429, 500, 502, 503, 504]),
+))
+
+# Per-feed ETag/Last-Modified validators plus the articles parsed from
+# the last 200, persisted across invocations so conditional GETs work
+# from the first cycle of a new process. A 304 answer skips the body
+# download and the feedparser pass but still contributes the cached
+# articles - "unchanged feed" must not read as "empty feed", since the
+# dashboard rebuilds its whole list from live fetch results.
+_FEED_META_PATH = os.path.join(os.path.dirname(__file__), 'feed_etags.json')
+_FEED_META = {}  # url -> {'etag': str, 'last_modified': str, 'articles': [dict]}
+_FEED_META_LOCK = threading.Lock()
+
+try:
+    with open(_FEED_META_PATH) as f:
+        _raw_meta = json.load(f)
+    _FEED_META = {
+        url: (meta if isinstance(meta, dict)
+              # Migrate the original [etag, last_modified] format
+              else {'etag': meta[0], 'last_modified': meta[1], 'articles': []})
+        for url, meta in _raw_meta.items()
+    }
+    del _raw_meta
+except Exception:
+    _FEED_META = {}
+
+def _save_feed_meta():
+    """Persist the validator map; best-effort (read-only FS is fine)"""
+    try:
+        with _FEED_META_LOCK:
+            snapshot = dict(_FEED_META)
+        with open(_FEED_META_PATH, 'w') as f:
+            json.dump(snapshot, f)
+    except Exception as e:
+        log.debug("⚠️ Could not persist feed validators: %s", e)
+
 # ✅ Complete RSS feeds with all our additions
 RSS_FEEDS = {
     # Tier 1 - High-volume industry sources
@@ -32,110 +92,136 @@ CRUDE_KEYWORDS = [
     "crude oil", "crude", "oil", "brent", "wti", "opec", "opec+",
     "oil price", "oil futures", "oil market", "petroleum", "barrel",
     "oil production", "oil supply", "oil inventories", "oil drilling",
-    "oil refinery", "oil rig", "oil pipeline", "shale oil"
+    "oil refinery", "oil rig", "oil pipeline", "shale oil",
 
     # Geopolitical, policy & infrastructure
     "oil sanctions", "oil embargo", "oil pipeline", "crude demand",
     "oil refinery", "oil rig", "petroleum", "middle east", "iran", "usa crude"
 ]
 
+# All keywords compiled into one alternation: a single scan of the text
+# replaces one substring search per keyword, and IGNORECASE avoids the
+# per-call .lower() copy. set() drops the duplicate entries in the list.
+_KW_RE = re.compile('|'.join(re.escape(k) for k in sorted(set(CRUDE_KEYWORDS))), re.IGNORECASE)
+
 def is_crude_related(text: str) -> bool:
-    """Check if text contains crude oil related keywords with debug logging"""
-    result = any(keyword in text.lower() for keyword in CRUDE_KEYWORDS)
-    print(f"🔍 Keyword filter check for: '{text[:75]}...' → Result: {result}")
-    return result
+    """Check if text contains crude oil related keywords"""
+    return _KW_RE.search(text) is not None
+
+def _fetch_one(source_name, url, limit_per_feed):
+    """Fetch, parse and keyword-filter one RSS feed; returns article dicts"""
+    collected = []
+    try:
+        log.debug("📡 FETCHING: %s (%s)", source_name, url)
+
+        headers = {}
+        with _FEED_META_LOCK:
+            meta = _FEED_META.get(url, {})
+            cached_articles = meta.get('articles') or []
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+
+        response = _session.get(url, timeout=15, headers=headers)
+
+        if response.status_code == 304:
+            if cached_articles:
+                # Copies, because downstream ingest mutates article dicts
+                log.debug("📡 %s unchanged (304), reusing %d cached articles",
+                          source_name, len(cached_articles))
+                return [dict(a) for a in cached_articles]
+            # Validators without articles: another process wrote the
+            # shared feed_etags.json for a feed version we never parsed.
+            # Fetch the body unconditionally rather than losing the feed.
+            log.debug("📡 %s returned 304 with no cached articles, refetching", source_name)
+            response = _session.get(url, timeout=15)
+
+        if response.status_code != 200:
+            log.warning("❌ HTTP Error for %s: %s", source_name, response.status_code)
+            return collected
+
+        feed = feedparser.parse(response.content)
+
+        if not feed.entries:
+            log.debug("⚠️ No entries in feed for %s", source_name)
+            return collected
+
+        for entry in feed.entries[:limit_per_feed]:
+            try:
+                title = entry.get('title', '').strip()
+                description = entry.get('description', entry.get('summary', '')).strip()
+                link = entry.get('link', '').strip()
+
+                if not title or not link:
+                    continue
+
+                combined_text = title + " " + description
+                if not is_crude_related(combined_text):
+                    continue
+
+                # Parse published date
+                try:
+                    if hasattr(entry, 'published_parsed') and entry.published_parsed:
+                        published_at = datetime(*entry.published_parsed[:6], tzinfo=timezone.utc)
+                    else:
+                        published_at = datetime.now(timezone.utc)
+                except:
+                    published_at = datetime.now(timezone.utc)
+
+                # Create article object (no database insertion)
+                collected.append({
+                    'title': title,
+                    'description': description,
+                    'link': link,
+                    'published_at': published_at.isoformat(),
+                    'source': f"RSS - {source_name}"
+                })
+
+            except Exception as e:
+                log.warning("❌ Error processing entry: %s", e)
+                continue
+
+        # Store validators and the parsed articles together so a later
+        # 304 can serve this parse instead of an empty list. Copies for
+        # the same mutation reason as above.
+        new_etag = response.headers.get('ETag', '')
+        new_lm = response.headers.get('Last-Modified', '')
+        if new_etag or new_lm:
+            with _FEED_META_LOCK:
+                _FEED_META[url] = {
+                    'etag': new_etag,
+                    'last_modified': new_lm,
+                    'articles': [dict(a) for a in collected],
+                }
+
+        log.debug("📊 %s SUMMARY: %d crude-related articles", source_name, len(collected))
+
+    except Exception as e:
+        log.warning("❌ Error fetching from %s: %s", source_name, e)
+
+    return collected
 
 def fetch_news_live(limit_per_feed=6):
     """Fetch crude oil news and return articles directly (no database)"""
     articles_collected = []
-    total_processed = 0
-    
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-    }
-    
-    print(f"🛢️ DEBUG: Starting news fetch from {len(RSS_FEEDS)} sources...")
-    print(f"🔍 DEBUG: RSS sources: {list(RSS_FEEDS.keys())}")
-    
-    for source_name, url in RSS_FEEDS.items():
-        try:
-            print(f"\n📡 FETCHING: {source_name}")
-            print(f"🔗 URL: {url}")
-            
-            response = requests.get(url, headers=headers, timeout=15)
-            print(f"📊 HTTP Status: {response.status_code}")
-            
-            if response.status_code != 200:
-                print(f"❌ HTTP Error for {source_name}: {response.status_code}")
-                continue
-            
-            feed = feedparser.parse(response.content)
-            print(f"📰 Raw entries found: {len(feed.entries)}")
-            
-            if not feed.entries:
-                print(f"⚠️ No entries in feed for {source_name}")
-                continue
-            
-            crude_related_count = 0
-            for i, entry in enumerate(feed.entries[:limit_per_feed]):
-                try:
-                    print(f"\n--- Processing Article {i+1} from {source_name} ---")
-                    
-                    title = entry.get('title', '').strip()
-                    description = entry.get('description', entry.get('summary', '')).strip()
-                    link = entry.get('link', '').strip()
-                    
-                    print(f"📰 Title: {title}")
-                    print(f"🔗 Link: {link[:80]}...")
-                    
-                    if not title or not link:
-                        print(f"❌ Missing title or link - SKIPPED")
-                        continue
-                    
-                    # Test keyword filter with debug output
-                    combined_text = title + " " + description
-                    if not is_crude_related(combined_text):
-                        print(f"❌ Failed keyword filter - SKIPPED")
-                        continue
-                    
-                    crude_related_count += 1
-                    total_processed += 1
-                    
-                    # Parse published date
-                    try:
-                        if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                            published_at = datetime(*entry.published_parsed[:6], tzinfo=timezone.utc)
-                        else:
-                            published_at = datetime.now(timezone.utc)
-                    except:
-                        published_at = datetime.now(timezone.utc)
-                    
-                    print(f"📅 Published date: {published_at}")
-                    
-                    # Create article object (no database insertion)
-                    article = {
-                        'title': title,
-                        'description': description,
-                        'link': link,
-                        'published_at': published_at.isoformat(),
-                        'source': f"RSS - {source_name}"
-                    }
-                    
-                    articles_collected.append(article)
-                    print(f"✅ SUCCESS: Article collected in memory!")
-                        
-                except Exception as e:
-                    print(f"❌ Error processing entry: {e}")
-                    continue
-            
-            print(f"📊 {source_name} SUMMARY: {crude_related_count} crude-related out of {len(feed.entries[:limit_per_feed])} articles")
-                    
-        except Exception as e:
-            print(f"❌ Error fetching from {source_name}: {e}")
-            continue
-    
-    print(f"\n🏁 RSS FINAL RESULT: {len(articles_collected)} articles collected from RSS sources")
-    print(f"📊 TOTAL PROCESSED: {total_processed} articles passed all filters")
+
+    log.debug("🛢️ Starting news fetch from %d sources...", len(RSS_FEEDS))
+
+    # One worker per feed: the GETs are independent network waits, so
+    # the fetch phase costs the slowest feed instead of the sum of all.
+    # The pooled session is thread-safe for these reads.
+    with ThreadPoolExecutor(max_workers=len(RSS_FEEDS)) as executor:
+        futures = [
+            executor.submit(_fetch_one, source_name, url, limit_per_feed)
+            for source_name, url in RSS_FEEDS.items()
+        ]
+        for future in as_completed(futures):
+            articles_collected.extend(future.result())
+
+    _save_feed_meta()
+
+    log.info("🏁 RSS FINAL RESULT: %d articles collected from RSS sources", len(articles_collected))
     return articles_collected
 
 # Backward compatibility aliases
@@ -1,5 +1,6 @@
 # newsapi_fetcher.py
 
+import logging
 import os
 import requests
 from datetime import datetime, timezone
@@ -8,12 +9,16 @@ import pytz
 tz = pytz.timezone("Asia/Kolkata")
 NEWSAPI_KEY = os.getenv("NEWSAPI_KEY")
 
+# Env-gated logger (same convention as database.py)
+log = logging.getLogger(__name__)
+log.setLevel(getattr(logging, os.getenv('LOG_LEVEL', 'INFO').upper(), logging.INFO))
+
 def fetch_newsapi_articles_live(query="crude oil OR OPEC OR inventory", limit=5):
     """Fetch NewsAPI articles live and return as list of dicts (database-free)"""
-    print(f"🔍 DEBUG: Starting NewsAPI live fetch with query: '{query}', limit: {limit}")
+    log.debug("🔍 Starting NewsAPI live fetch with query: '%s', limit: %d", query, limit)
     
     if not NEWSAPI_KEY:
-        print("❌ NEWSAPI_KEY not found in environment.")
+        log.warning("❌ NEWSAPI_KEY not found in environment.")
         return []
 
     url = "https://newsapi.org/v2/everything"
@@ -26,52 +31,40 @@ def fetch_newsapi_articles_live(query="crude oil OR OPEC OR inventory", limit=5)
     }
 
     try:
-        print(f"📡 Fetching from NewsAPI with query: {query}")
-        print(f"🔗 URL: {url}")
-        
         response = requests.get(url, params=params, timeout=15)
-        print(f"📊 HTTP Status: {response.status_code}")
-        
+
         if response.status_code != 200:
-            print(f"❌ HTTP Error: {response.status_code}")
+            log.warning("❌ HTTP Error: %s", response.status_code)
             return []
             
         data = response.json()
 
         if data.get("status") != "ok":
-            print(f"❌ NewsAPI error: {data.get('message')}")
+            log.warning("❌ NewsAPI error: %s", data.get('message'))
             return []
 
         articles_collected = []
         total_found = len(data.get("articles", []))
-        print(f"✅ Found {total_found} articles from NewsAPI")
+        log.debug("✅ Found %d articles from NewsAPI", total_found)
 
         for i, article in enumerate(data["articles"]):
             try:
-                print(f"\n--- Processing NewsAPI Article {i+1} ---")
-                
                 title = article.get("title", "").strip()
                 link = article.get("url", "").strip()
                 source = f"NewsAPI - {article.get('source', {}).get('name', 'Unknown')}"
                 description = article.get("description", "").strip()
                 published_at_str = article.get("publishedAt", "")
 
-                print(f"📰 Title: {title}")
-                print(f"🔗 Link: {link[:80]}...")
-                print(f"📡 Source: {source}")
-
                 if not title or not link:
-                    print(f"❌ Missing title or link - SKIPPED")
                     continue
 
                 # Parse published date
                 try:
                     published_at = datetime.strptime(published_at_str, "%Y-%m-%dT%H:%M:%SZ")
                     published_at = published_at.replace(tzinfo=timezone.utc)
-                    print(f"📅 Published date: {published_at}")
                 except Exception as e:
                     published_at = datetime.now(timezone.utc)
-                    print(f"⚠️ Date parse failed, using current time: {e}")
+                    log.debug("⚠️ Date parse failed, using current time: %s", e)
 
                 # Create article object (no database insertion)
                 article_dict = {
@@ -83,17 +76,16 @@ def fetch_newsapi_articles_live(query="crude oil OR OPEC OR inventory", limit=5)
                 }
 
                 articles_collected.append(article_dict)
-                print(f"✅ SUCCESS: NewsAPI article collected in memory!")
 
             except Exception as e:
-                print(f"❌ Error processing NewsAPI article: {e}")
+                log.warning("❌ Error processing NewsAPI article: %s", e)
                 continue
 
-        print(f"\n🏁 NewsAPI FINAL RESULT: {len(articles_collected)} articles collected")
+        log.info("🏁 NewsAPI FINAL RESULT: %d articles collected", len(articles_collected))
         return articles_collected
 
     except Exception as e:
-        print(f"❌ Error fetching NewsAPI data: {e}")
+        log.warning("❌ Error fetching NewsAPI data: %s", e)
         return []
 
 # Backward compatibility alias - keeps old function name working
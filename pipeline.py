@@ -0,0 +1,70 @@
+# pipeline.py - shared article pipeline helpers for app.py and auto_alerts.py
+
+import hashlib
+import re
+import time
+from datetime import datetime
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+# ciso8601 parses ISO timestamps in C and handles the trailing 'Z'
+# natively; fall back to stdlib fromisoformat if it isn't installed
+try:
+    import ciso8601
+    CISO_AVAILABLE = True
+except ImportError:
+    CISO_AVAILABLE = False
+
+def safe_parse_dt(published_at):
+    """Parse an ISO published_at string, returning None on failure"""
+    try:
+        if CISO_AVAILABLE:
+            return ciso8601.parse_datetime(published_at)
+        return datetime.fromisoformat(published_at.replace('Z', '+00:00'))
+    except:
+        return None
+
+# Query params that vary per click without changing the story,
+# precompiled once so the per-param check is a single C-level match
+_TRACK_RE = re.compile(r'^(?:utm_|fbclid|gclid)')
+
+def canonical(url):
+    """Normalize a link for dedup: strip tracking query params, the
+    fragment and any trailing slash so URL variants of the same story
+    collapse to one key"""
+    try:
+        # Most feed links carry no query or fragment - skip the full
+        # split/rebuild round-trip for those
+        if '?' not in url and '#' not in url and not url.endswith('/'):
+            return url
+        parts = urlsplit(url)
+        query = urlencode([
+            (k, v) for k, v in parse_qsl(parts.query)
+            if not _TRACK_RE.match(k)
+        ])
+        return urlunsplit((parts.scheme, parts.netloc, parts.path.rstrip('/'), query, ''))
+    except Exception:
+        return url
+
+def dedup_key(article):
+    """Stable 16-byte dedup key for an article, hashed from its
+    canonical link (title as fallback for linkless entries)"""
+    link = article.get('link', '')
+    text = canonical(link) if link else article.get('title', '')
+    return hashlib.blake2b(text.encode(), digest_size=16).digest()
+
+def filter_last_hour_articles(articles):
+    """Keep only articles published within the last hour.
+
+    Prefers the _pub_ts epoch field cached at ingest; falls back to
+    parsing published_at for articles that haven't been through ingest.
+    """
+    cutoff_ts = time.time() - 3600
+    recent = []
+    for article in articles:
+        pub_ts = article.get('_pub_ts')
+        if pub_ts is None:
+            dt = safe_parse_dt(article.get('published_at', ''))
+            pub_ts = dt.timestamp() if dt else 0
+        if pub_ts > cutoff_ts:
+            recent.append(article)
+    return recent
@@ -1,6 +1,7 @@
 import os
+import json
 import google.generativeai as genai
-from typing import Tuple
+from typing import List, Tuple
 
 # Configure Gemini AI
 api_key = os.getenv('GEMINI_API_KEY')
@@ -13,12 +14,23 @@ else:
     model = genai.GenerativeModel('gemini-pro')
     GEMINI_AVAILABLE = True
 
+# Memo of completed Gemini analyses keyed by article content. Successive
+# fetch windows overlap heavily (15-minute cycles over a 1-hour window),
+# so articles analyzed in a previous cycle skip the LLM call entirely.
+_analysis_memo = {}
+_ANALYSIS_MEMO_MAX = 4096
+
 def analyze_article_live(title: str, description: str) -> Tuple[str, str]:
     """Analyze article with Gemini AI and return summary and sentiment (database-free)"""
+    memo_key = hash((title, description))
+    cached = _analysis_memo.get(memo_key)
+    if cached is not None:
+        return cached
+
     try:
         if not GEMINI_AVAILABLE:
             return analyze_article_fallback(title, description)
-        
+
         print(f"🤖 Analyzing with Gemini AI: {title[:50]}...")
         
         prompt = f"""
@@ -60,6 +72,12 @@ def analyze_article_live(title: str, description: str) -> Tuple[str, str]:
             summary = "AI analysis completed - see full article for details."
         
         print(f"✅ AI Analysis complete: {sentiment} sentiment")
+
+        # Only successful Gemini results are memoized - fallback answers
+        # stay uncached so they get retried once Gemini recovers
+        if len(_analysis_memo) >= _ANALYSIS_MEMO_MAX:
+            _analysis_memo.clear()
+        _analysis_memo[memo_key] = (summary, sentiment)
         return summary, sentiment
         
     except Exception as e:
@@ -114,6 +132,85 @@ def analyze_article_fallback(title: str, description: str) -> Tuple[str, str]:
         print(f"❌ Fallback analysis error: {e}")
         return "Analysis unavailable", "Neutral"
 
+def analyze_articles_batch(pairs: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
+    """Analyze several (title, description) pairs in one Gemini call.
+
+    Stacking articles into a single prompt amortizes the HTTPS round-trip
+    and prompt overhead across the batch instead of paying it per article.
+    Returns (summary, sentiment) tuples aligned with the input order;
+    articles the batch response misses fall back to the per-article path.
+    """
+    if not pairs:
+        return []
+    if not GEMINI_AVAILABLE:
+        return [analyze_article_fallback(title, desc) for title, desc in pairs]
+
+    # Serve memo hits up front so only unseen articles go in the prompt
+    results = [None] * len(pairs)
+    miss_indices = []
+    for i, (title, desc) in enumerate(pairs):
+        cached = _analysis_memo.get(hash((title, desc)))
+        if cached is not None:
+            results[i] = cached
+        else:
+            miss_indices.append(i)
+
+    if miss_indices:
+        try:
+            print(f"🤖 Batch analyzing {len(miss_indices)} articles with Gemini AI...")
+
+            articles_block = "\n\n".join(
+                f"Article {n+1}:\nTitle: {pairs[i][0]}\nDescription: {pairs[i][1]}"
+                for n, i in enumerate(miss_indices)
+            )
+            prompt = f"""
+            Analyze these {len(miss_indices)} crude oil market news articles. For each article provide:
+            1. A concise 2-sentence summary focusing on key market impact
+            2. Market sentiment: Bullish, Bearish, or Neutral
+
+            {articles_block}
+
+            Respond with only a JSON array, one object per article in the same order:
+            [{{"summary": "...", "sentiment": "Bullish"}}, ...]
+            """
+
+            response = model.generate_content(prompt)
+            text = response.text.strip()
+            # Gemini often wraps JSON in a markdown code fence
+            if text.startswith('```'):
+                text = text.strip('`').strip()
+                if text.startswith('json'):
+                    text = text[4:].strip()
+            parsed = json.loads(text)
+
+            for n, i in enumerate(miss_indices):
+                if n >= len(parsed):
+                    break
+                item = parsed[n] or {}
+                summary = (item.get('summary') or '').strip()
+                sentiment_text = (item.get('sentiment') or '').lower()
+                if 'bullish' in sentiment_text:
+                    sentiment = "Bullish"
+                elif 'bearish' in sentiment_text:
+                    sentiment = "Bearish"
+                else:
+                    sentiment = "Neutral"
+                if summary:
+                    if len(_analysis_memo) >= _ANALYSIS_MEMO_MAX:
+                        _analysis_memo.clear()
+                    _analysis_memo[hash(pairs[i])] = (summary, sentiment)
+                    results[i] = (summary, sentiment)
+
+        except Exception as e:
+            print(f"❌ Gemini batch error: {e}")
+
+    # Anything the batch didn't cover goes through the single-article path
+    for i, result in enumerate(results):
+        if result is None:
+            results[i] = analyze_article_live(pairs[i][0], pairs[i][1])
+
+    return results
+
 def process_unanalyzed_articles():
     """Dummy function for backward compatibility with database-free architecture"""
     print("📝 Note: process_unanalyzed_articles called in live mode - returning 0")
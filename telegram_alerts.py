@@ -1,11 +1,27 @@
 import os
 import hashlib
+from collections import OrderedDict
 from telegram import Bot
 from datetime import datetime, timezone, timedelta
 import asyncio
 
-# Global cache for duplicate prevention (persistent during app runtime)
-alerted_articles_cache = set()
+from pipeline import safe_parse_dt
+
+# Global cache for duplicate prevention (persistent during app runtime).
+# OrderedDict used as an LRU set: oldest entries are evicted past the cap
+# so a long-lived process can't grow the cache without bound.
+alerted_articles_cache = OrderedDict()
+ALERT_CACHE_MAX = 5000
+
+def _mark_alerted(article_id: str):
+    """Record an alerted article id, evicting the oldest past the cap"""
+    alerted_articles_cache[article_id] = None
+    if len(alerted_articles_cache) > ALERT_CACHE_MAX:
+        alerted_articles_cache.popitem(last=False)
+
+# Sentiments worth alerting on - frozenset so the per-article membership
+# check is a hash lookup against one shared constant, not a fresh list
+ALERTABLE_SENTIMENTS = frozenset(('bullish', 'bearish'))
 
 # Configure multiple Telegram bots
 TELEGRAM_BOTS = [
@@ -21,22 +37,29 @@ TELEGRAM_BOTS = [
     },
     {
         "name": "Bot 3",
-        "token": os.getenv('TELEGRAM_BOT_TOKEN_3'), 
+        "token": os.getenv('TELEGRAM_BOT_TOKEN_3'),
         "chat_id": os.getenv('TELEGRAM_CHAT_ID_3')
     }
 ]
 
+# Build Bot clients once at import so repeated sends reuse the client
+# (and its connection pool) instead of constructing a fresh Bot per message
+for _bot_config in TELEGRAM_BOTS:
+    _bot_config["bot"] = Bot(token=_bot_config["token"]) if _bot_config["token"] else None
+
 def get_article_id(title: str, link: str) -> str:
-    """Generate unique ID to prevent duplicate alerts"""
-    return hashlib.md5((title + link).encode()).hexdigest()
+    """Generate unique ID to prevent duplicate alerts.
+
+    blake2b with an 8-byte digest is faster than md5 and plenty for an
+    in-memory dedup set; the IDs never leave the process, so changing
+    the algorithm is safe.
+    """
+    return hashlib.blake2b((title + link).encode(), digest_size=8).hexdigest()
 
 def format_published_time(published_at: str) -> str:
     """Format published time to match your desired format"""
-    try:
-        dt = datetime.fromisoformat(published_at.replace('Z', '+00:00'))
-        return dt.strftime("%b %d, %I:%M %p")
-    except:
-        return "Unknown time"
+    dt = safe_parse_dt(published_at)
+    return dt.strftime("%b %d, %I:%M %p") if dt else "Unknown time"
 
 def get_impact_description(sentiment: str) -> str:
     """Get impact description based on sentiment"""
@@ -47,10 +70,31 @@ def get_impact_description(sentiment: str) -> str:
     }
     return impact_map.get(sentiment, "Market impact assessment pending.")
 
+async def _send_to_bot(bot_config, message, disable_preview=True) -> bool:
+    """Send one message through one bot; returns True on success"""
+    bot_name = bot_config.get('name', 'Unknown Bot')
+    bot = bot_config.get('bot')
+    chat_id = bot_config.get('chat_id')
+
+    if not bot or not chat_id:
+        print(f"⚠️ {bot_name}: Missing credentials - skipped")
+        return False
+
+    try:
+        await bot.send_message(
+            chat_id=chat_id,
+            text=message,
+            parse_mode='Markdown',
+            disable_web_page_preview=disable_preview
+        )
+        print(f"✅ {bot_name}: Alert sent successfully")
+        return True
+    except Exception as e:
+        print(f"❌ {bot_name}: Error sending alert - {e}")
+        return False
+
 async def send_enhanced_telegram_alert_multi(article) -> int:
     """Send beautifully formatted Telegram alert to all configured bots"""
-    successful_sends = 0
-    
     # Extract article data safely
     title = article.get('title', 'No Title')
     source = article.get('source', 'Unknown Source')
@@ -79,33 +123,12 @@ async def send_enhanced_telegram_alert_multi(article) -> int:
 🔗 [Read full article]({link})
     """
     
-    # Send to all configured bots
-    for bot_config in TELEGRAM_BOTS:
-        bot_name = bot_config.get('name', 'Unknown Bot')
-        token = bot_config.get('token')
-        chat_id = bot_config.get('chat_id')
-        
-        if not token or not chat_id:
-            print(f"⚠️ {bot_name}: Missing credentials - skipped")
-            continue
-        
-        try:
-            bot = Bot(token=token)
-            await bot.send_message(
-                chat_id=chat_id,
-                text=message,
-                parse_mode='Markdown',
-                disable_web_page_preview=True
-            )
-            
-            print(f"✅ {bot_name}: Alert sent successfully")
-            successful_sends += 1
-            
-        except Exception as e:
-            print(f"❌ {bot_name}: Error sending alert - {e}")
-            continue
-    
-    return successful_sends
+    # Fan the sends out concurrently - the bots are independent, so the
+    # per-article delivery time is one Telegram round-trip, not three
+    results = await asyncio.gather(
+        *[_send_to_bot(bot_config, message) for bot_config in TELEGRAM_BOTS]
+    )
+    return sum(results)
 
 async def send_automatic_alerts(articles) -> int:
     """Send alerts for recent articles (last 1 hour) with duplicate prevention to all bots"""
@@ -126,18 +149,17 @@ async def send_automatic_alerts(articles) -> int:
     for i, article in enumerate(articles):
         try:
             # Check if article is from last 1 hour
-            published_at = article.get('published_at', '')
-            if not published_at:
+            published_dt = safe_parse_dt(article.get('published_at', ''))
+            if not published_dt:
                 continue
-                
-            published_dt = datetime.fromisoformat(published_at.replace('Z', '+00:00'))
+
             if published_dt <= cutoff_time:
                 print(f"⏰ Article {i+1} too old - skipped")
                 continue
             
             # Check sentiment - only alert for Bullish/Bearish
             sentiment = article.get('sentiment', '')
-            if sentiment.lower() not in ['bullish', 'bearish']:
+            if sentiment.lower() not in ALERTABLE_SENTIMENTS:
                 print(f"😐 Article {i+1} neutral sentiment - skipped")
                 continue
             
@@ -154,7 +176,7 @@ async def send_automatic_alerts(articles) -> int:
             
             if successful_sends > 0:
                 # Mark as alerted to prevent duplicates
-                alerted_articles_cache.add(article_id)
+                _mark_alerted(article_id)
                 total_alerts_sent += 1
                 print(f"🎯 Alert sent to {successful_sends}/{valid_bots} bots")
                 
@@ -172,7 +194,6 @@ async def send_automatic_alerts(articles) -> int:
 
 async def send_test_alert():
     """Send enhanced test alert to all bots"""
-    successful_tests = 0
     current_time = datetime.now(timezone.utc).strftime('%b %d, %I:%M %p')
     
     message = f"""🚨 CrudeIntel 2.0 Multi-Bot Test Alert
@@ -186,30 +207,11 @@ async def send_test_alert():
 ✅ *Enhanced multi-bot alert system is operational!*
     """
     
-    for bot_config in TELEGRAM_BOTS:
-        bot_name = bot_config.get('name', 'Unknown Bot')
-        token = bot_config.get('token')
-        chat_id = bot_config.get('chat_id')
-        
-        if not token or not chat_id:
-            print(f"⚠️ {bot_name}: Missing credentials - skipped")
-            continue
-        
-        try:
-            bot = Bot(token=token)
-            await bot.send_message(
-                chat_id=chat_id,
-                text=message,
-                parse_mode='Markdown'
-            )
-            
-            print(f"✅ {bot_name}: Test alert sent successfully")
-            successful_tests += 1
-            
-        except Exception as e:
-            print(f"❌ {bot_name}: Test alert failed - {e}")
-            continue
-    
+    results = await asyncio.gather(
+        *[_send_to_bot(bot_config, message, disable_preview=False)
+          for bot_config in TELEGRAM_BOTS]
+    )
+    successful_tests = sum(results)
     return successful_tests > 0
 
 def get_alert_stats():